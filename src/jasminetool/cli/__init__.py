@@ -7,12 +7,7 @@ Command Line Interface for JasmineTool (Typer-based)
 This module provides the main entry point for the JasmineTool CLI using Typer.
 """
 
-import sys
-import traceback
-from typing import List, Optional
-
 import typer
-from typing_extensions import Annotated
 
 from .init import init_jasminetool
 from .target import target_app
@@ -14,9 +14,7 @@ def init_jasminetool(
         logger.warning(f"Config file already exists at {path}, use --force to overwrite")
         return
 
-    if not Path(path).parent.exists():
-        logger.info(f"Creating parent directory for {path}")
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
     
     config = JasmineConfig()
     save_config(config, path)
\ No newline at end of file
@@ -1,28 +1,50 @@
 import typer
-import yaml
 from pathlib import Path
 import subprocess
+import sys
+from typing import Optional
+
+from jasminetool.config import load_yaml, dump_yaml
 
 sweep_app = typer.Typer(name="sweep")
 
 @sweep_app.command(name="start")
 def start_sweep(
-    file_path: str = typer.Option(..., "--file", "-f", help="The path to the sweep file")
+    file_path: str = typer.Option(..., "--file", "-f", help="The path to the sweep file"),
+    log_path: Optional[str] = typer.Option(None, "--log", "-l", help="Also write the wandb sweep output to this file"),
 ):
     sweep_file_path = Path(file_path)
     sweep_file_name = sweep_file_path.name
-    if sweep_file_name.endswith(".yaml"):
-        sweep_file_name = sweep_file_name[:-5]
-    if sweep_file_name.endswith(".yml"):
-        sweep_file_name = sweep_file_name[:-4]
+    if sweep_file_name.endswith((".yaml", ".yml")):
+        sweep_file_name = sweep_file_name.rsplit(".", 1)[0]
 
     # change the name in the yaml file to the name of the sweep file
     with open(sweep_file_path, "r") as f:
-        sweep_config = yaml.safe_load(f)
-    sweep_config["name"] = sweep_file_name
-    with open(sweep_file_path, "w") as f:
-        yaml.dump(sweep_config, f)
+        sweep_config = load_yaml(f)
+    # Only write the file back when the name actually changes
+    if sweep_config.get("name") != sweep_file_name:
+        sweep_config["name"] = sweep_file_name
+        with open(sweep_file_path, "w") as f:
+            dump_yaml(sweep_config, f)
 
     # run the sweep
-    full_cmd = f"wandb sweep {sweep_file_path}"
-    subprocess.run(full_cmd, shell=True)
\ No newline at end of file
+    cmd = ["wandb", "sweep", str(sweep_file_path)]
+    try:
+        if log_path is None:
+            returncode = subprocess.run(cmd).returncode
+        else:
+            # Tee the output ourselves instead of going through a shell and `tee`; pass the bytes through
+            # untouched so a non-UTF-8 locale can't break on wandb's emoji output
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, "wb") as log_f:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                for line in proc.stdout:
+                    sys.stdout.buffer.write(line)
+                    sys.stdout.buffer.flush()
+                    log_f.write(line)
+                returncode = proc.wait()
+    except FileNotFoundError:
+        typer.echo("✗ wandb not found on PATH, please install it first (e.g. `uv add wandb`)", err=True)
+        raise typer.Exit(code=1)
+    if returncode != 0:
+        raise typer.Exit(code=returncode)
@@ -1,14 +1,13 @@
-from pygments.lexer import default
 import typer
 from jasminetool.config import JasmineConfig, load_config
-from jasminetool.core import load_server
-from typing import List, Union, Optional, Tuple
-from jasminetool.core import SSHServer, K8sServer
+from typing import List, Union, Optional, Tuple, TYPE_CHECKING
 import select
 import sys
 
 from jasminetool.cli.util import interactive_select_server_name, get_server_name_list, parse_sweep_id
-from jasminetool.core import Server
+
+if TYPE_CHECKING:
+    from jasminetool.core import Server
 
 import rich
 from rich.panel import Panel
@@ -24,6 +23,39 @@ def _prompt_with_timeout(prompt: str, timeout: int) -> Optional[str]:
         rich.print()  # for a new line after timeout
         return None
 
+def _prompt_gpu_and_nprocs(gpu_config: str, num_processes: int) -> Tuple[str, int]:
+    rich.print(Panel(
+        Text("Entering interactive mode. You have 3 seconds for each prompt.\nPress Enter to use the default value.", justify="center"),
+        title="[bold blue]Interactive Configuration[/bold blue]",
+        border_style="blue"
+    ))
+
+    # Prompt for gpu_config
+    user_gpu_config = _prompt_with_timeout(f"Enter GPU config (default: [green]{gpu_config}[/green]): ", 3)
+    
+    if user_gpu_config is None:
+        # Nobody is at the keyboard, so skip the second prompt and take both defaults
+        rich.print(f"Timeout. Using default GPU config: [yellow]{gpu_config}[/yellow] and number of processes: [yellow]{num_processes}[/yellow]")
+        return gpu_config, num_processes
+    elif user_gpu_config == "":
+        rich.print(f"Empty input. Using default GPU config: [yellow]{gpu_config}[/yellow]")
+    else:
+        gpu_config = user_gpu_config
+
+    # Prompt for num_processes
+    user_num_processes = _prompt_with_timeout(f"Enter number of processes (default: [green]{num_processes}[/green]): ", 3)
+
+    if user_num_processes is None:
+        rich.print(f"Timeout. Using default number of processes: [yellow]{num_processes}[/yellow]")
+    elif user_num_processes == "":
+        rich.print(f"Empty input. Using default number of processes: [yellow]{num_processes}[/yellow]")
+    else:
+        try:
+            num_processes = int(user_num_processes)
+        except ValueError:
+            rich.print(f"[red]Invalid input. Expected an integer.[/red] Using default number of processes: [yellow]{num_processes}[/yellow]")
+    return gpu_config, num_processes
+
 target_app = typer.Typer(
     name="target",
     help="JasmineTool - Automated multi-GPU/multi-host orchestration via SSH",
@@ -36,23 +68,27 @@ def _init_config(config_path: str):
     config = load_config(config_path)
     return config
 
+def _load_server(name: str, config: JasmineConfig) -> "Server":
+    # Import lazily: fabric/paramiko are only needed once we actually talk to a server
+    from jasminetool.core import load_server
+    return load_server(name, config)
+
 def _check_name(name: Union[str, List[str]], config: JasmineConfig):
     if isinstance(name, str):
         name = [name]
-    server_name_list = get_server_name_list(config)
-    if not set(name).issubset(set(server_name_list)):
-        raise ValueError(f"Server config not found for name: {name}, current available names: {server_name_list}")
+    if not all(config.has_server_config(n) for n in name):
+        raise ValueError(f"Server config not found for name: {name}, current available names: {get_server_name_list(config)}")
 
-def _common_check_and_return_server(config: JasmineConfig, name: Optional[str], interactive: bool) -> Tuple[Server, str]:
+def _common_check_and_return_server(config: JasmineConfig, name: Optional[str], interactive: bool) -> Tuple["Server", str]:
     if interactive and name is None:
         name = interactive_select_server_name(config)
     if name is None:
         raise ValueError("Name is required, use --interactive (-i) to select a target")
     _check_name(name, config)
-    server = load_server(name, config)
+    server = _load_server(name, config)
     return server, name
 
-def _common_check_and_return_server_list(config: JasmineConfig, name: Optional[str], interactive: bool) -> Tuple[List[Server], List[str]]:
+def _common_check_and_return_server_list(config: JasmineConfig, name: Optional[str], interactive: bool) -> Tuple[List["Server"], List[str]]:
     if interactive and name is None:
         name = interactive_select_server_name(config)
 
@@ -65,7 +101,7 @@ def _common_check_and_return_server_list(config: JasmineConfig, name: Optional[s
         name_list = [name]
 
     _check_name(name_list, config)
-    server_list = [load_server(name, config) for name in name_list]
+    server_list = [_load_server(name, config) for name in name_list]
     return server_list, name_list
 
 @target_app.command(name="init")
@@ -105,7 +141,8 @@ def check_target(
         status = server.test()
         status_text = Text("✅ SUCCESS", style="green") if status else Text("❌ FAILED", style="red")
 
-        path_status = server.check_path(server.config.work_dir)
+        # No point probing the path on a host we just failed to reach
+        path_status = status and server.check_path(server.config.work_dir)
         path_status_text = Text("✅ SUCCESS", style="green") if path_status else Text("❌ FAILED", style="red")
         
         # Assuming server object has a config attribute holding its specific config
@@ -139,7 +176,7 @@ def sync_target(
     """
     config = _init_config(config_path)
     _check_name(name, config)
-    server = load_server(name, config)
+    server = _load_server(name, config)
     if not server.sync():
         raise ValueError("Sync failed, please check the source dir andtarget server")
 
@@ -155,47 +192,27 @@ def start_target(
     """
     config = _init_config(config_path)
     _check_name(name, config)
-    server = load_server(name, config)
+    server = _load_server(name, config)
     sweep_id = parse_sweep_id(config)
 
-    if server.config.mode == "remote_ssh" and isinstance(server, SSHServer):
+    # Import only the backend this target uses, so the other one is never loaded
+    if server.config.mode == "remote_ssh":
+        from jasminetool.core.SSHServer import SSHServer
+        if not isinstance(server, SSHServer):
+            raise ValueError(f"Server is not an SSHServer: {server}")
         gpu_config = server.server_config.gpu_config
         num_processes = server.server_config.num_processes
         wandb_key = server.gloabl_config.wandb_key
 
-        if interactive:
-            rich.print(Panel(
-                Text("Entering interactive mode. You have 3 seconds for each prompt.\nPress Enter to use the default value.", justify="center"),
-                title="[bold blue]Interactive Configuration[/bold blue]",
-                border_style="blue"
-            ))
-
-            # Prompt for gpu_config
-            user_gpu_config = _prompt_with_timeout(f"Enter GPU config (default: [green]{gpu_config}[/green]): ", 3)
-            
-            if user_gpu_config is None:
-                rich.print(f"Timeout. Using default GPU config: [yellow]{gpu_config}[/yellow]")
-            elif user_gpu_config == "":
-                rich.print(f"Empty input. Using default GPU config: [yellow]{gpu_config}[/yellow]")
-            else:
-                gpu_config = user_gpu_config
-
-            # Prompt for num_processes
-            user_num_processes = _prompt_with_timeout(f"Enter number of processes (default: [green]{num_processes}[/green]): ", 3)
-
-            if user_num_processes is None:
-                rich.print(f"Timeout. Using default number of processes: [yellow]{num_processes}[/yellow]")
-            elif user_num_processes == "":
-                rich.print(f"Empty input. Using default number of processes: [yellow]{num_processes}[/yellow]")
-            else:
-                try:
-                    num_processes = int(user_num_processes)
-                except ValueError:
-                    rich.print(f"[red]Invalid input. Expected an integer.[/red] Using default number of processes: [yellow]{server.server_config.num_processes}[/yellow]")
-                    num_processes = server.server_config.num_processes
+        # Nobody can answer the prompts without a terminal, so don't wait out their timeouts
+        if interactive and sys.stdin.isatty():
+            gpu_config, num_processes = _prompt_gpu_and_nprocs(gpu_config, num_processes)
         
         server.start(sweep_id=sweep_id, gpu_config=gpu_config, num_processes=num_processes, wandb_key=wandb_key)
-    elif server.config.mode == "remote_k8s" and isinstance(server, K8sServer):
+    elif server.config.mode == "remote_k8s":
+        from jasminetool.core.K8Server import K8sServer
+        if not isinstance(server, K8sServer):
+            raise ValueError(f"Server is not a K8sServer: {server}")
         gpu_config = "0"
         num_processes = server.server_config.num_processes
         wandb_key = server.global_config.wandb_key
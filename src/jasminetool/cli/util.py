@@ -37,14 +37,10 @@ def parse_sweep_id(config: JasmineConfig) -> str:
     if not sweep_file_path.exists():
         raise ValueError(f"Sweep file not found: {sweep_file_path}")
 
-    with open(sweep_file_path, "r") as f:
-        content = f.read()
-
-    lines = content.strip().split('\n')
-    for line in lines:
-        if 'wandb agent' in line and 'Run sweep agent with:' in line:
-            parts = line.split('wandb agent')
-            if len(parts) > 1:
-                sweep_id = parts[-1].strip()
+    # Stream the file and stop at the first agent line instead of reading it all
+    with open(sweep_file_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if 'wandb agent' in line and 'Run sweep agent with:' in line:
+                sweep_id = line.rsplit('wandb agent', 1)[1].strip()
                 return sweep_id
     raise ValueError(f"No sweep ID found in the sweep file: {config.sweep_file_path}")
\ No newline at end of file
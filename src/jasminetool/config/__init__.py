@@ -1,4 +1,5 @@
 from .jasmine_config import JasmineConfig, \
                                 load_config, save_config, BaseConfig, RemoteK8sConfig, RemoteSSHConfig
+from .file_utils import atomic_write, load_yaml, dump_yaml
 
-__all__ = ["JasmineConfig", "load_config", "save_config", "BaseConfig", "RemoteK8sConfig", "RemoteSSHConfig"]
\ No newline at end of file
+__all__ = ["JasmineConfig", "load_config", "save_config", "BaseConfig", "RemoteK8sConfig", "RemoteSSHConfig", "atomic_write", "load_yaml", "dump_yaml"]
\ No newline at end of file
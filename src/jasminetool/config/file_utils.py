@@ -0,0 +1,50 @@
+import os
+import secrets
+import stat
+from pathlib import Path
+from typing import Any, IO, Optional, Union
+import yaml
+
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+def load_yaml(stream: IO) -> Any:
+    return yaml.load(stream, Loader=_Loader)
+
+def dump_yaml(data: Any, stream: Optional[IO] = None, **kwargs) -> Optional[str]:
+    return yaml.dump(data, stream, Dumper=_Dumper, **kwargs)
+
+def atomic_write(path: Union[str, Path], data: bytes) -> None:
+    """
+    Write data to path via a temp file in the same directory + fsync + os.replace, so a crash never
+    leaves a half-written file. Symlinks are resolved so the link target is replaced, and the existing
+    file's permissions are kept; a new file gets the usual 0666 & ~umask from os.open.
+    """
+    target = os.path.realpath(path)
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    # Not mkstemp: it always creates 0600, while os.open applies the process umask itself
+    tmp_path = os.path.join(os.path.dirname(target), f".{os.path.basename(target)}.{secrets.token_hex(4)}.tmp")
+    tmp_fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        try:
+            f = os.fdopen(tmp_fd, "wb")
+        except BaseException:
+            os.close(tmp_fd)
+            raise
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Type, Union, Any
 from dacite import from_dict
-import yaml
 import os
 from pathlib import Path
 from loguru import logger
+from .file_utils import atomic_write, load_yaml, dump_yaml
 
 @dataclass
 class BaseConfig:
@@ -30,6 +30,11 @@ class RemoteSSHConfig(BaseConfig):
     proxy_ip: Optional[str] = None
     proxy_port: Optional[int] = 22
 
+    # Optional: zlib-compress the SSH transport (helps on slow links with text payloads)
+    ssh_compress: bool = False
+    # Seconds allowed for the TCP connect and the SSH handshake, for the target and the proxy alike
+    ssh_connect_timeout: int = 10
+
 @dataclass
 class RemoteK8sConfig(BaseConfig):
     user_name: str
@@ -43,6 +48,7 @@ class RemoteK8sConfig(BaseConfig):
     proxy_user: Optional[str] = None
     proxy_ip: Optional[str] = None
     proxy_port: Optional[int] = 22
+    ssh_compress: bool = False
 
     common_config: dict[str, str] = field(default_factory=lambda: {
         "QUEUE_NAME": "YOUR_QUEUE_NAME",
@@ -112,6 +118,9 @@ class JasmineConfig:
     wandb_project: Optional[str] = field(default_factory=lambda: os.path.basename(os.getcwd()))
     env_vars: Optional[dict[str, str]] = field(default_factory=lambda: {})
 
+    def has_server_config(self, name: str) -> bool:
+        return any(server.name == name for server in self.server_config_list)
+
     def load_server_config(self, name: str) -> Union[RemoteSSHConfig, RemoteK8sConfig]:
         for server in self.server_config_list:
             if server.name == name:
@@ -126,7 +135,7 @@ class JasmineConfig:
             logger.error("path must end with .yaml")
         
         with open(path, "r") as f:
-            raw_dict = yaml.safe_load(f)
+            raw_dict = load_yaml(f)
 
         servers_raw = raw_dict.pop("servers", [])
         servers = []
@@ -151,8 +160,8 @@ class JasmineConfig:
         out_dict["servers"] = [asdict(s) for s in self.server_config_list]
         del out_dict["server_config_list"]
 
-        with open(path, "w") as f:
-            yaml.safe_dump(out_dict, f, sort_keys=False)
+        # atomic_write swaps in a complete file, so a crash never leaves a half-written config
+        atomic_write(path, dump_yaml(out_dict, sort_keys=False).encode("utf-8"))
 
         logger.info(f"Saved config to {path}")
 
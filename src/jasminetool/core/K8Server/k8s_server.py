@@ -6,11 +6,14 @@ from .utils import create_connection
 from pathlib import Path
 import hashlib
 from loguru import logger
-import yaml
 import re
 import os
 
-from jasminetool.core.K8Server import project_sync_and_start
+# Template variables that may be given as ints in the config and must be rendered as strings
+_NUMERIC_KEYS = frozenset({"GPU_NUM", "CPU_NUM", "MEMORY_NUM"})
+# ${VAR_NAME:-default_value}
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^:]+):-([^}]+)\}')
+_TEMPLATE_VAR_PATTERN = re.compile(r'\$\{([^:}]+):-[^}]*\}')
 
 class K8sServer(Server):
     def __init__(self, global_config: JasmineConfig, server_config: RemoteK8sConfig):
@@ -18,6 +21,7 @@ class K8sServer(Server):
         self.global_config = global_config
         self.server_config = server_config
         self.conn = create_connection(server_config)
+        self._upload_dir_ready = False
         self.conn.run("echo 'Connection successful'")
     
     def _with_env_vars(self, command_str: str) -> str:
@@ -51,16 +55,13 @@ class K8sServer(Server):
         script_name = f"{pre_fix}-{hash_str}.{type_str}"
         # save to .jasminetool/temp/
         temp_save_path = Path("./.jasminetool/temp", script_name)
-        if not temp_save_path.exists():
-            temp_save_path.parent.mkdir(parents=True, exist_ok=True)
-            temp_save_path.touch()
+        temp_save_path.parent.mkdir(parents=True, exist_ok=True)
         with open(temp_save_path, "w") as f:
             f.write(script_str)
-        try:
-            self.conn.run(f"test -d {self.server_config.upload_script_path}")
-        except Exception as e:
-            logger.warning(f"The path {self.server_config.upload_script_path} does not exist, will create it on the host server")
-            self.conn.run(f"mkdir -p {self.server_config.upload_script_path}")
+        # `mkdir -p` is idempotent, so one call replaces the `test -d` probe; only needed once per server
+        if not self._upload_dir_ready:
+            self.conn.run(f"mkdir -p {self.server_config.upload_script_path}", hide=True)
+            self._upload_dir_ready = True
         self.conn.put(temp_save_path, f"{self.server_config.upload_script_path}/{script_name}")
         return f"{script_name}"
 
@@ -238,8 +239,7 @@ class K8sServer(Server):
         Extract environment variables from the template string
         env_vars: ${VAR_NAME:-default_value} or ${VAR_NAME}
         """
-        pattern = r'\$\{([^:]+):-([^}]+)\}'
-        matches = re.findall(pattern, template_str)
+        matches = _ENV_VAR_PATTERN.findall(template_str)
         env_vars = {}
         for match in matches:
             variable_name = match[0]
@@ -253,9 +253,14 @@ class K8sServer(Server):
         # replace the variables with the environment variables
         # note in the template yaml_str, the variables are like ${VAR_NAME:-default_value} or ${VAR_NAME}
         """
-        for key, value in env_vars.items():
-            if key in ["GPU_NUM", "CPU_NUM", "MEMORY_NUM"] and isinstance(value, int):
+        def _replace(match: re.Match) -> str:
+            key = match.group(1)
+            if key not in env_vars:
+                return match.group(0)
+            value = env_vars[key]
+            if key in _NUMERIC_KEYS and isinstance(value, int):
                 value = str(value)
-            pattern = r'\$\{' + re.escape(key) + r':-[^}]*\}'
-            template_str = re.sub(pattern, value, template_str)
-        return template_str
+            return value
+
+        # One pass over the template instead of one regex compile + sub per variable
+        return _TEMPLATE_VAR_PATTERN.sub(_replace, template_str)
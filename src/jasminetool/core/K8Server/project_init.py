@@ -1,3 +1,4 @@
+import os
 from jasminetool.config import JasmineConfig, RemoteK8sConfig
 
 class ProjectInitializer:
@@ -68,7 +69,6 @@ echo "Project initialization completed"
             f.write(bash_script)
         
         # Make the file executable
-        import os
         os.chmod(output_path, 0o755)
         
         return output_path
@@ -231,7 +231,6 @@ echo "✅ Project installation completed successfully!"
             f.write(install_script)
         
         # Make the file executable
-        import os
         os.chmod(output_path, 0o755)
         
         return output_path
@@ -1,6 +1,7 @@
 from jasminetool.config import JasmineConfig, RemoteK8sConfig
-import subprocess
+from jasminetool.core.git_utils import read_git_status, format_changes, remote_git_sync_cmd
 from loguru import logger
+import shlex
 
 class ProjectSyncAndStart:
     def __init__(self, global_config: JasmineConfig, server_config: RemoteK8sConfig):
@@ -24,22 +25,23 @@ class ProjectSyncAndStart:
         """
         Only need to reset to the target branch && commit
         """
-        if not self._check_git_clean():
-            raise ValueError("Git repo is not clean")
-
-        # get the current branch
-        branch = self._get_current_branch()
-        if branch is None:
+        # one `git status` gives both the current branch and the dirty check
+        git_status = read_git_status(self.src_dir)
+        if git_status is None:
             raise ValueError("Failed to get current branch")
+        branch, head, changes = git_status
+        logger.info(f"✓ Current branch: {branch}")
+
+        if not self._check_git_clean(changes):
+            raise ValueError("Git repo is not clean")
 
         # sync the git branch one the target branch, writing bash script
+        ref = shlex.quote(branch)
         sync_script = f"""
-echo "Syncing git branch {branch}..." && \
+printf 'Syncing git branch %s...\\n' {ref} && \
 cd {self.server_config.work_dir} && \
-{self._with_env_vars("git fetch --all && ")}
-{self._with_env_vars(f"git checkout {branch} || git checkout -b {branch} origin/{branch} && ")}
-{self._with_env_vars(f"git reset --hard origin/{branch} && ")}
-echo "✓ Git branch {branch} synced"
+{self._with_env_vars(f"{remote_git_sync_cmd(branch, head)} && ")}
+printf '✓ Git branch %s synced\\n' {ref}
 """
         return sync_script
 
@@ -168,20 +170,11 @@ echo "🎉 Job execution finished"
         return script
         
 
-    def _check_git_clean(self) -> bool:
-        res = subprocess.run(f"cd {self.src_dir} && git status --porcelain", shell=True, capture_output=True)
-        if res.stdout.strip():
-            logger.error(f"✗ Source repo not clean:\n{res.stdout}")
+    def _check_git_clean(self, changes: list[str]) -> bool:
+        if changes:
+            changes_str = format_changes(changes)
+            logger.error(f"✗ Source repo not clean:\n{changes_str}")
             return False
         else:
             logger.info(f"✓ Source repo is clean")
-        return True
-    
-    def _get_current_branch(self) -> str | None:
-        res = subprocess.run(f"cd {self.src_dir} && git rev-parse --abbrev-ref HEAD", shell=True, capture_output=True)
-        if res.returncode != 0:
-            logger.error(f"✗ Failed to get current branch:\n{res.stderr}")
-            return None
-        branch = res.stdout.strip().decode()
-        logger.info(f"✓ Current branch: {branch}")
-        return branch
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -1,4 +1,4 @@
-from jasminetool.config import JasmineConfig, RemoteK8sConfig
+from jasminetool.config import RemoteK8sConfig
 from fabric import Connection
 from paramiko import RSAKey
 import os
@@ -7,6 +7,7 @@ def create_connection(server_config: RemoteK8sConfig) -> Connection:
     connect_kwargs = {}
     connect_kwargs["pkey"] = RSAKey.from_private_key_file(os.path.expanduser("~/.ssh/id_rsa"))
     connect_kwargs["look_for_keys"] = False
+    connect_kwargs["compress"] = server_config.ssh_compress
 
     return Connection(
         host=server_config.server_ip,
@@ -7,23 +7,28 @@ class ProjectInitializer:
         self.global_config = global_config
         self.server_config = server_config
         self.conn = connection
+        # The env/PATH preamble is the same for every remote call, so build it once
+        env_prefix = ""
+        for env_var, env_value in self.global_config.env_vars.items():
+            env_prefix = f'export {env_var}={env_value} && {env_prefix}'
+        self._env_prefix = f'{env_prefix}export PATH="$HOME/.local/bin:$HOME/.cargo/bin:$HOME/.x-cmd.root/bin:$PATH" && '
     
     def _with_uv_xcmd_env(self, cmd: str) -> str:
-        base_cmd = f'export PATH="$HOME/.local/bin:$HOME/.cargo/bin:$HOME/.x-cmd.root/bin:$PATH" && {cmd} '
-        for env_var, env_value in self.global_config.env_vars.items():
-            base_cmd = f'export {env_var}={env_value} && {base_cmd}'
-        return base_cmd
+        return f'{self._env_prefix}{cmd} '
 
 
     def run(self, force: bool = False):
         logger.info(f"Initializing project on {self.conn.host}")
 
+        # Probe for x-cmd and uv in a single remote call
+        installed = self._probe_tools(["x-cmd", "uv"])
+
         # Step 1: Install x-cmd if needed
-        if not self._check_and_install_x_cmd():
+        if not self._check_and_install_x_cmd("x-cmd" in installed):
             return False
 
         # Step 2: Install uv if needed
-        if not self._check_and_install_uv():
+        if not self._check_and_install_uv("uv" in installed):
             return False
 
         # Step 3: Clone GitHub repo if not exists
@@ -50,10 +55,14 @@ class ProjectInitializer:
         logger.info(f"[{self.server_config.name}] 🎉 Initialization complete!")
         return True
     
-    def _check_and_install_x_cmd(self) -> bool:
+    def _probe_tools(self, tools: list[str]) -> set[str]:
+        probe = "; ".join(f"command -v {tool} > /dev/null && echo {tool}" for tool in tools)
+        result = self.conn.run(self._with_uv_xcmd_env(f"{{ {probe}; }}"), warn=True, hide=True)
+        return set(result.stdout.split())
+
+    def _check_and_install_x_cmd(self, installed: bool) -> bool:
         logger.info("🔧 Checking x-cmd...")
-        result = self.conn.run(self._with_uv_xcmd_env("command -v x-cmd"), warn=True, hide=True)
-        if result.ok:
+        if installed:
             logger.info(f"[{self.server_config.name}] ✓ x-cmd is already installed")
             return True
 
@@ -67,10 +76,9 @@ class ProjectInitializer:
             logger.error(f"[{self.server_config.name}] ✗ Failed to install x-cmd")
             return False
         
-    def _check_and_install_uv(self) -> bool:
+    def _check_and_install_uv(self, installed: bool) -> bool:
         logger.info(f"[{self.server_config.name}] 🔧 Checking uv...")
-        result = self.conn.run(self._with_uv_xcmd_env("command -v uv"), warn=True, hide=True)
-        if result.ok:
+        if installed:
             logger.info(f"[{self.server_config.name}] ✓ uv is already installed")
             return True
         
@@ -86,7 +94,7 @@ class ProjectInitializer:
     
     def _clone_repo(self, force: bool = False) -> bool:
         # check if the repo is already cloned
-        result = self.conn.run(f"ls {self.server_config.work_dir}", warn=True, hide=True)
+        result = self.conn.run(f"test -e {self.server_config.work_dir}", warn=True, hide=True)
 
         if result.ok and not force:
             logger.info(f"result: {result}")
@@ -6,36 +6,41 @@ from rich.panel import Panel
 from rich import box
 import time
 
+TMUX_WIDTH = 400
+TMUX_HEIGHT = 200
+
 class ProjectStarter:
     def __init__(self, global_config: JasmineConfig, connection: Connection, server_config: RemoteSSHConfig):
         self.global_config = global_config
         self.server_config = server_config
         self.conn = connection
         self.console = Console()
-
-    def _with_env(self, cmd: str) -> str:
+        # The env/PATH preamble is the same for every pane, so build it once
         env_cmd = ""
         if hasattr(self.global_config, "env_vars") and self.global_config.env_vars:
             env_vars = self.global_config.env_vars
             for key, value in env_vars.items():
                 env_cmd += f'export {key}="{value}" && '
-        return f'{env_cmd}export PATH="$HOME/.local/bin:$HOME/.cargo/bin:$HOME/.x-cmd.root/bin:$PATH" && {cmd}'
+        self._env_prefix = f'{env_cmd}export PATH="$HOME/.local/bin:$HOME/.cargo/bin:$HOME/.x-cmd.root/bin:$PATH" && '
 
-    def _has_gpu(self) -> bool:
-        result = self.conn.run("command -v nvidia-smi", warn=True, hide=True)
-        return result.ok
-
-    def _detect_gpu_count(self) -> int:
-        result = self.conn.run("nvidia-smi --query-gpu=name --format=csv,noheader | wc -l", warn=True, hide=True)
-        if result.ok:
-            try:
-                return int(result.stdout.strip())
-            except ValueError:
-                return 0
-        return 0
+    def _with_env(self, cmd: str) -> str:
+        return f'{self._env_prefix}{cmd}'
+
+    def _probe_remote(self, count_gpus: bool) -> tuple[bool, bool, bool, int]:
+        cmd = f"test -d {self.server_config.work_dir} && echo work_dir; command -v tmux > /dev/null && echo tmux; command -v nvidia-smi > /dev/null && echo nvidia-smi"
+        if count_gpus:
+            # nvidia-smi only lists GPUs this user may use (cgroup limits), unlike the driver's /proc listing
+            cmd += " && nvidia-smi --query-gpu=name --format=csv,noheader | wc -l"
+        result = self.conn.run(cmd, warn=True, hide=True)
+        lines = result.stdout.split()
+        has_work_dir = "work_dir" in lines
+        has_tmux = "tmux" in lines
+        has_gpu = "nvidia-smi" in lines
+        gpu_count = int(lines[-1]) if has_gpu and count_gpus and lines[-1].isdigit() else 0
+        return has_work_dir, has_tmux, has_gpu, gpu_count
 
     def _generate_session_name(self, sweep_id: str) -> str:
-        short_sweep_id = sweep_id.split("/")[-1] if "/" in sweep_id else sweep_id
+        short_sweep_id = sweep_id.rpartition("/")[2]
         timestamp = time.strftime("%m%d%H%M")
         return f"{short_sweep_id}_{timestamp}"
 
@@ -51,10 +56,9 @@ class ProjectStarter:
 
         self.console.print(table)
     
-    def _get_gpu_ids(self, gpu_config: str, has_gpu: bool) -> list[str]:
+    def _get_gpu_ids(self, gpu_config: str, has_gpu: bool, gpu_count: int) -> list[str]:
         if gpu_config == "0":
             if has_gpu:
-                gpu_count = self._detect_gpu_count()
                 gpu_ids = [str(i) for i in range(gpu_count)] if gpu_count > 0 else ["0"]
                 if gpu_count == 0:
                     self.console.print("[yellow]⚠ No GPUs detected, defaulting to GPU 0[/yellow]")
@@ -68,39 +72,63 @@ class ProjectStarter:
     def run(self, sweep_id: str, gpu_config: str, num_processes: int, wandb_key: str):
         self.console.rule(f"🚀 Starting wandb agents on [bold blue]{self.conn.host}[/bold blue]")
 
-        has_gpu = self._has_gpu()
-        gpu_ids = self._get_gpu_ids(gpu_config, has_gpu)
+        # One remote call checks the work dir, tmux and nvidia-smi and, only when auto-detecting, counts GPUs
+        has_work_dir, has_tmux, has_gpu, gpu_count = self._probe_remote(count_gpus=gpu_config == "0")
+        if not has_work_dir:
+            # tmux would silently start the panes somewhere else, so stop here instead
+            self.console.print(f"[bold red]✗ Work dir {self.server_config.work_dir} not found on {self.conn.host}, please run `jt target init` first[/bold red]")
+            return False
+        if not has_tmux:
+            self.console.print(f"[bold red]✗ tmux not found on {self.conn.host}, please install it first[/bold red]")
+            return False
+        gpu_ids = self._get_gpu_ids(gpu_config, has_gpu, gpu_count)
 
         session_name = self._generate_session_name(sweep_id)
 
-        result = self.conn.run(f"tmux new-session -d -s {session_name}", warn=True, hide=True)
+        # Start the session (and every split below) in work_dir so panes need no `cd` preamble.
+        # A detached session defaults to 80x24, which runs out of room for split-window with many panes
+        work_dir = self.server_config.work_dir
+        result = self.conn.run(f"tmux new-session -d -s {session_name} -c {work_dir} -x {TMUX_WIDTH} -y {TMUX_HEIGHT}", warn=True, hide=True)
         if not result.ok:
-            self.console.print(f"[bold red]✗ Failed to create tmux session: {session_name}[/bold red]")
+            # e.g. a duplicate name from a second start within the same minute; that session isn't ours to clean up
+            self.console.print(f"[bold red]✗ Failed to create tmux session {session_name}: {result.stderr.strip()}[/bold red]")
             return False
 
-        self.console.print(f"[green]📟 Created tmux session:[/green] {session_name}")
-        self._print_summary(session_name, gpu_ids, num_processes, has_gpu)
+        # Chain every pane step with `\;` so the session is filled in one remote call
+        tmux_cmds = []
+        started_msgs = []
 
-        first_pane = True
+        # Everything but CUDA_VISIBLE_DEVICES is the same for every pane
+        split_cmds = [f"split-window -t {session_name} -c {work_dir}", f"select-layout -t {session_name} tiled"]
+        agent_cmd = f"{self.server_config.command_runner} wandb agent {sweep_id}"
+        cmd_prefix = self._with_env(f"export WANDB_API_KEY={wandb_key} && ")
         for gpu_id in gpu_ids:
+            if has_gpu:
+                final_cmd = f"{cmd_prefix}CUDA_VISIBLE_DEVICES={gpu_id} {agent_cmd}"
+            else:
+                final_cmd = f"{cmd_prefix}{agent_cmd}"
+            send_cmd = f'send-keys -t {session_name} "{final_cmd}" C-m'
+
             for i in range(num_processes):
-                if not first_pane:
-                    self.conn.run(f"tmux split-window -t {session_name}", warn=True, hide=True)
-                    self.conn.run(f"tmux select-layout -t {session_name} tiled", warn=True, hide=True)
+                if started_msgs:
+                    tmux_cmds.extend(split_cmds)
+                tmux_cmds.append(send_cmd)
 
-                wandb_cmd = f"wandb agent {sweep_id}"
-                base_cmd = f"cd {self.server_config.work_dir} && export WANDB_API_KEY={wandb_key} && "
-                if has_gpu:
-                    full_cmd = f"{base_cmd}CUDA_VISIBLE_DEVICES={gpu_id} {self.server_config.command_runner} {wandb_cmd}"
-                else:
-                    full_cmd = f"{base_cmd}{self.server_config.command_runner} {wandb_cmd}"
+                msg = f"✅ Started process {i+1} on GPU {gpu_id}" if has_gpu else f"✅ Started process {i+1} (CPU-only)"
+                started_msgs.append(msg)
 
-                final_cmd = self._with_env(full_cmd)
-                self.conn.run(f'tmux send-keys -t {session_name} "{final_cmd}" C-m', warn=True, hide=True)
+        result = self.conn.run("tmux " + " \\; ".join(tmux_cmds), warn=True, hide=True)
+        if not result.ok:
+            # tmux stops a `\;` chain at the first failing step, leaving a half-built session with some agents
+            # already running, so tear down the session this run created (`=` makes the target an exact match)
+            self.conn.run(f"tmux kill-session -t ={session_name}", warn=True, hide=True)
+            self.console.print(f"[bold red]✗ Failed to set up tmux session {session_name}: {result.stderr.strip()}[/bold red]")
+            return False
 
-                msg = f"✅ Started process {i+1} on GPU {gpu_id}" if has_gpu else f"✅ Started process {i+1} (CPU-only)"
-                self.console.print(f"[bold green]{msg}[/bold green]")
-                first_pane = False
+        self.console.print(f"[green]📟 Created tmux session:[/green] {session_name}")
+        self._print_summary(session_name, gpu_ids, num_processes, has_gpu)
+        for msg in started_msgs:
+            self.console.print(f"[bold green]{msg}[/bold green]")
 
         self.console.print(Panel.fit(
             f"🎉 All wandb agents started in tmux session: [bold cyan]{session_name}[/bold cyan]\n"
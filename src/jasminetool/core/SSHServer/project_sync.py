@@ -1,9 +1,15 @@
 from pathlib import Path
-from typing import Dict
+from typing import Optional
 from fabric import Connection
 from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
+import json
+import shlex
 import subprocess
 from jasminetool.config import RemoteSSHConfig, JasmineConfig
+from jasminetool.core.git_utils import read_git_status, format_changes, remote_git_sync_cmd
+
+DVC_STDERR_TAIL = 2048
 
 class ProjectSync:
     def __init__(self, conn: Connection, server_config: RemoteSSHConfig, global_config: JasmineConfig):
@@ -15,6 +21,7 @@ class ProjectSync:
         self.github_url = server_config.github_url
         self.dvc_cache = server_config.dvc_cache
         self.dvc_remote = server_config.dvc_remote
+        self._dvc_start_error: Optional[OSError] = None
 
     def _with_env(self, cmd: str) -> str:
         return (
@@ -25,38 +32,73 @@ class ProjectSync:
     def run(self, force: bool = False, verbose: bool = False) -> bool:
         logger.info(f"[{self.server.name}] 🔄 Starting sync...")
         
-        # check if the repo is already cloned
-        if not self._ensure_work_dir(): return False
-
-        # check if the git urls match
-        if not self._check_git_urls_match(): return False
-        if not self._check_git_clean(): return False
-        if not self._check_dvc_clean(): return False
-
-        # get the current branch
-        branch = self._get_current_branch()
-        if branch is None: return False
+        # The local git/dvc checks don't depend on the remote work dir, so run them while it is probed
+        dvc_proc = None
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                git_future = pool.submit(read_git_status, self.src_dir)
+                dvc_proc = self._start_dvc_status()
+
+                # check if the repo is already cloned and the git urls match
+                ready = self._ensure_work_dir() and self._check_git_urls_match()
+
+                # one `git status` gives both the current branch and the dirty check
+                git_status = git_future.result()
+
+            if ready and git_status is None:
+                logger.error(f"[{self.server.name}] ✗ Failed to read git status of {self.src_dir}")
+            if not ready or git_status is None or not self._check_git_clean(git_status[2]):
+                return False
+            branch, head, _ = git_status
+            if not self._check_dvc_clean(dvc_proc): return False
+        finally:
+            # Reap the background dvc status on every early exit, including SSH errors raised by conn.run
+            if dvc_proc and dvc_proc.returncode is None:
+                dvc_proc.kill()
+                dvc_proc.wait()
 
         # sync the git branch
-        if not self._sync_git(branch): return False
+        if not self._sync_git(branch, head): return False
 
-        # setup the dvc cache
-        if not self._setup_dvc_cache(): return False
-
-        # setup the dvc remote
-        if not self._setup_dvc_remote(): return False
-
-        # pull the dvc remote
-        if not self._dvc_pull(): return False
+        # setup the dvc cache and remote, then pull
+        if not self._setup_and_pull_dvc(): return False
 
         logger.info(f"[{self.server.name}] 🎉 Sync completed successfully on branch {branch}")
         return True
     
-    def _check_dvc_clean(self) -> bool:
-        res = subprocess.run(f"cd {self.work_dir} && uv run dvc status", shell=True, capture_output=True)
-        logger.info(f"[{self.server.name}] 📍 DVC status:\n{res.stdout}")
-        if res.stdout.strip() not in [b'Data and pipelines are up to date.', b'There are no data or pipelines tracked in this project yet.\nSee <https://dvc.org/doc/start> to get started!', b'']:
-            logger.error(f"[{self.server.name}] ✗ DVC repo not clean:\n{res.stdout}")
+    def _start_dvc_status(self) -> Optional[subprocess.Popen]:
+        # This guards the local checkout we sync from, so check src_dir (work_dir is a remote path).
+        # Without a .dvc directory there is nothing to check, so skip the uv + interpreter startup
+        if not (self.src_dir / ".dvc").is_dir():
+            return None
+        try:
+            return subprocess.Popen(["uv", "run", "dvc", "status", "--json"], cwd=self.src_dir, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            # e.g. uv not on PATH; kept for _check_dvc_clean, which reports it as not clean
+            self._dvc_start_error = e
+            return None
+
+    def _check_dvc_clean(self, dvc_proc: Optional[subprocess.Popen]) -> bool:
+        if self._dvc_start_error is not None:
+            logger.error(f"[{self.server.name}] ✗ dvc status could not run: {self._dvc_start_error}")
+            return False
+        if dvc_proc is None:
+            logger.info(f"[{self.server.name}] ℹ️  No DVC repo found, skipping DVC status")
+            return True
+        stdout, stderr = dvc_proc.communicate()
+        if dvc_proc.returncode != 0:
+            # A failed status is not a clean repo; only the tail of stderr is worth showing (tracebacks can be huge)
+            tail = stderr[-DVC_STDERR_TAIL:].decode("utf-8", "replace")
+            logger.error(f"[{self.server.name}] ✗ dvc status failed (exit {dvc_proc.returncode}):\n{tail}")
+            return False
+        logger.info(f"[{self.server.name}] 📍 DVC status:\n{stdout}")
+        try:
+            # --json prints `{}` when data and pipelines are up to date
+            is_clean = not json.loads(stdout or b"{}")
+        except ValueError:
+            is_clean = stdout.strip() in [b'Data and pipelines are up to date.', b'There are no data or pipelines tracked in this project yet.\nSee <https://dvc.org/doc/start> to get started!', b'']
+        if not is_clean:
+            logger.error(f"[{self.server.name}] ✗ DVC repo not clean:\n{stdout}")
             return False
         logger.info(f"[{self.server.name}] ✓ DVC repo is clean")
         return True
@@ -66,82 +108,51 @@ class ProjectSync:
         # 这里假设成功
         return True
 
-    def _check_git_clean(self) -> bool:
-        res = subprocess.run(f"cd {self.src_dir} && git status --porcelain", shell=True, capture_output=True)
-        if res.stdout.strip():
-            logger.error(f"[{self.server.name}] ✗ Source repo not clean:\n{res.stdout}")
+    def _check_git_clean(self, changes: list[str]) -> bool:
+        if changes:
+            changes_str = format_changes(changes)
+            logger.error(f"[{self.server.name}] ✗ Source repo not clean:\n{changes_str}")
             return False
         logger.info(f"[{self.server.name}] ✓ Source repo is clean")
         return True
 
-    def _get_current_branch(self) -> str | None:
-        # res = self.conn.run(f"cd {self.src_dir} && git rev-parse --abbrev-ref HEAD",
-        #                     hide=False, warn=True)
-        # if not res.ok:
-        #     logger.error(f"[{self.server.name}] ✗ Failed to get branch")
-        #     return None
-        # branch = res.stdout.strip()
-        # logger.info(f"[{self.server.name}] 📍 Current branch: {branch}")
-        branch = subprocess.run(f"cd {self.src_dir} && git rev-parse --abbrev-ref HEAD", shell=True, capture_output=True).stdout.decode('utf-8').strip()
-        return branch
-
     def _ensure_work_dir(self) -> bool:
-        res = self.conn.run(self._with_env(f"ls {self.work_dir}"), hide=True, warn=True)
+        res = self.conn.run(f"test -d {self.work_dir}", hide=True, warn=True)
         if not res.ok:
             logger.warning(f"[{self.server.name}] Work dir {self.work_dir} missing, please run `jt target init` to initialize")
             return False
         logger.info(f"[{self.server.name}] ✓ Work dir exists")
         return True
 
-    def _sync_git(self, branch: str) -> bool:
-        cmds = [
-            f"cd {self.work_dir} && git fetch --all",
-            f"cd {self.work_dir} && git checkout {branch} || git checkout -b {branch} origin/{branch}",
-            f"cd {self.work_dir} && git reset --hard origin/{branch}"
-        ]
-        for c in cmds:
-            res = self.conn.run(self._with_env(c), pty=True, warn=True)
-            if not res.ok:
-                logger.error(f"[{self.server.name}] ✗ Git sync failed at: {c}")
-                return False
+    def _sync_git(self, branch: str, head: str) -> bool:
+        c = f"cd {self.work_dir} && {remote_git_sync_cmd(branch, head)}"
+        res = self.conn.run(self._with_env(c), pty=True, warn=True)
+        if not res.ok:
+            logger.error(f"[{self.server.name}] ✗ Git sync failed at: {c}")
+            return False
         logger.info(f"[{self.server.name}] ✓ Git branch {branch} synced")
         return True
 
-    def _setup_dvc_cache(self) -> bool:
-        if not self.dvc_cache:
+    def _setup_and_pull_dvc(self) -> bool:
+        # cache dir, remote and pull share one `uv run` environment and one remote call
+        steps = []
+        if self.dvc_cache:
+            steps.append(f"dvc cache dir --local {self.dvc_cache}")
+        else:
             logger.info("ℹ️  No DVC cache configured, skipping")
-            return True
-        cmd = self._with_env(f"cd {self.work_dir} && uv run dvc cache dir --local {self.dvc_cache}")
-        res = self.conn.run(cmd, pty=True, warn=True)
-        if res.ok:
-            logger.info(f"[{self.server.name}] ✓ DVC cache set to {self.dvc_cache}")
-            return True
+        if self.dvc_remote:
+            steps.append(f'dvc remote add --local jasmine_remote "{self.dvc_remote}" --force')
+            steps.append("dvc pull -r jasmine_remote --force")
         else:
-            logger.error(f"[{self.server.name}] ✗ Failed to set DVC cache")
-            return False
-
-    def _setup_dvc_remote(self) -> bool:
-        if not self.dvc_remote:
-            logger.info("ℹ️  No DVC remote configured, skipping")
+            logger.info("ℹ️  No DVC remote configured, skipping pull")
+        if not steps:
             return True
-        cmd = self._with_env(
-            f'cd {self.work_dir} && uv run dvc remote add --local jasmine_remote "{self.dvc_remote}" --force'
-        )
-        res = self.conn.run(cmd, pty=True, warn=True)
-        if res.ok or "already exists" in res.stderr:
-            logger.info(f"[{self.server.name}] ✓ DVC remote configured")
-            return True
-        logger.error(f"[{self.server.name}] ✗ Failed to set DVC remote")
-        return False
 
-    def _dvc_pull(self) -> bool:
-        if not self.dvc_remote:
-            logger.info("ℹ️  No DVC remote set, skipping pull")
-            return True
-        cmd = self._with_env(f"cd {self.work_dir} && uv run dvc pull -r jasmine_remote --force")
+        script = " && ".join(steps)
+        cmd = self._with_env(f"cd {self.work_dir} && uv run sh -c {shlex.quote(script)}")
         res = self.conn.run(cmd, pty=True, warn=True)
-        if res.ok:
-            logger.info(f"[{self.server.name}] ✓ DVC pull succeeded")
-            return True
-        logger.error(f"[{self.server.name}] ✗ Failed DVC pull")
-        return False
\ No newline at end of file
+        if not res.ok:
+            logger.error(f"[{self.server.name}] ✗ DVC setup failed at: {script}")
+            return False
+        logger.info(f"[{self.server.name}] ✓ DVC cache/remote configured and pulled")
+        return True
@@ -1,9 +1,7 @@
 from jasminetool.core import Server
 from jasminetool.config import RemoteSSHConfig, JasmineConfig
-from fabric import Connection, Config
-from fabric.transfer import Transfer
+from fabric import Connection
 from paramiko import RSAKey
-from invoke.exceptions import UnexpectedExit
 from rich.prompt import Confirm
 from loguru import logger
 from .project_init import ProjectInitializer
@@ -21,11 +19,16 @@ class SSHServer(Server):
         connect_kwargs = {}
         connect_kwargs["pkey"] = RSAKey.from_private_key_file(config.private_key_path)
         connect_kwargs["look_for_keys"] = False
+        connect_kwargs["compress"] = config.ssh_compress
 
         # Handle proxy jump via bastion if specified
         if config.proxy_ip and config.proxy_user:
             proxy_str = f"{config.proxy_user}@{config.proxy_ip}:{config.proxy_port}"
-            proxy_conn = Connection(proxy_str)
+            proxy_conn = Connection(
+                proxy_str,
+                connect_timeout=config.ssh_connect_timeout,
+                connect_kwargs={"compress": config.ssh_compress},
+            )
             gateway = proxy_conn
         else:
             gateway = None
@@ -35,6 +38,7 @@ class SSHServer(Server):
             user=config.user_name,
             port=config.server_port if config.server_port else None,
             gateway=gateway,
+            connect_timeout=config.ssh_connect_timeout,
             connect_kwargs=connect_kwargs,
         )
         return conn
@@ -53,7 +57,7 @@ class SSHServer(Server):
 
     def _check_path(self, path: str) -> bool:
         try:
-            result = self.connection.run(f"ls {path}", hide=True)
+            result = self.connection.run(f"test -e {path}", hide=True, warn=True)
             return result.ok
         except Exception as e:
             logger.error(f"[{self.config.name}] Failed to check path: {e}")
@@ -1,6 +1,6 @@
 from .base import Server
 from .manage import load_server
-from .SSHServer import SSHServer
-from .K8Server import K8sServer
 
-__all__ = ["Server", "load_server", "SSHServer", "K8sServer"]
\ No newline at end of file
+# The backends live in jasminetool.core.SSHServer / jasminetool.core.K8Server and are imported per mode
+# by load_server, so importing jasminetool.core doesn't load both of them
+__all__ = ["Server", "load_server"]
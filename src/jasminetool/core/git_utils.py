@@ -0,0 +1,69 @@
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import shlex
+import shutil
+import subprocess
+
+# An absolute git path plus close_fds=False lets subprocess use posix_spawn instead of fork + exec;
+# leaving fds open is safe because Python creates them non-inheritable (PEP 446)
+_GIT = shutil.which("git") or "git"
+
+# Number of space-separated fields before the path in each porcelain v2 record type
+_PATH_FIELD = {"1": 8, "2": 9, "u": 10}
+
+def _short_entry(line: str) -> str:
+    """Reduce a porcelain v2 record to the short `XY path` form of `git status --short`."""
+    kind = line[:1]
+    if kind in ("?", "!"):
+        return f"{kind * 2} {line[2:]}"
+    if kind not in _PATH_FIELD:
+        return line
+    fields = line.split(" ", _PATH_FIELD[kind])
+    xy = fields[1].replace(".", " ")
+    path = fields[-1]
+    if kind == "2":
+        # renames/copies carry `path<TAB>origPath`
+        path, _, orig = path.partition("\t")
+        path = f"{orig} -> {path}"
+    return f"{xy} {path}"
+
+def read_git_status(src_dir: Union[str, Path]) -> Optional[Tuple[str, str, List[str]]]:
+    """
+    Return (branch, HEAD commit, changed entries) for src_dir from a single `git status --porcelain=v2 --branch`,
+    or None if git fails. A detached HEAD is reported as "HEAD", like `git rev-parse --abbrev-ref HEAD`.
+    """
+    res = subprocess.run([_GIT, "-C", str(src_dir), "status", "--porcelain=v2", "--branch"], capture_output=True, text=True, close_fds=False)
+    if res.returncode != 0:
+        return None
+
+    branch = "HEAD"
+    oid = ""
+    changes = []
+    for line in res.stdout.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid "):]
+        elif line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            branch = "HEAD" if head == "(detached)" else head
+        elif not line.startswith("#"):
+            changes.append(_short_entry(line))
+    return branch, oid, changes
+
+def remote_git_sync_cmd(branch: str, head: str) -> str:
+    """
+    Shell command that moves a checkout on the target to origin/<branch>. The fetch is skipped when
+    origin/<branch> there already points at `head` (e.g. re-syncing the same commit), and `checkout -f -B`
+    creates or resets the local branch and discards local edits, like checkout + `reset --hard`.
+    """
+    ref = shlex.quote(branch)
+    fetch = f'{{ [ "$(git rev-parse -q --verify origin/{ref})" = {shlex.quote(head)} ] || git fetch --no-tags --prune origin {ref}; }}'
+    return f"{fetch} && git checkout -f -B {ref} origin/{ref}"
+
+# Only the first few dirty entries are worth printing; a huge listing just buries the error
+MAX_LISTED_CHANGES = 10
+
+def format_changes(changes: List[str]) -> str:
+    listed = "\n".join(changes[:MAX_LISTED_CHANGES])
+    if len(changes) > MAX_LISTED_CHANGES:
+        listed += f"\n... and {len(changes) - MAX_LISTED_CHANGES} more"
+    return listed
@@ -1,16 +1,38 @@
 import json
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 import typer
 from rich.console import Console
 from rich.table import Table
-from jasminetool.config import JasmineConfig
+from jasminetool.config import JasmineConfig, atomic_write
 from jasminetool.cli.util import get_server_name_list
 
 console = Console()
 
+# Prefer orjson for tasks.json when it is installed; fall back to the stdlib encoder/decoder
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Matches a JSON string literal (kept) or a `//` comment running to end of line (dropped)
+_COMMENT_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*')
+
+def _strip_json_comments(content: str) -> str:
+    return _COMMENT_PATTERN.sub(lambda m: "" if m.group(0).startswith("//") else m.group(0), content)
+
 def install_vscode_tasks(config: JasmineConfig, targets: Optional[List[str]] = None, force: bool = False) -> bool:
     def _ensure_vscode_dir() -> Optional[Path]:
         try:
@@ -21,19 +43,27 @@ def install_vscode_tasks(config: JasmineConfig, targets: Optional[List[str]] = N
             console.print(f"[red]✗ Failed to create .vscode directory: {e}[/red]")
             return None
 
-    def _load_tasks(file: Path) -> Optional[Dict[str, Any]]:
-        if not file.exists(): return None
+    def _load_tasks(file: Path) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
         try:
-            content = file.read_text(encoding='utf-8')
-            content = re.sub(r"//.*", "", content)
-            return json.loads(content)
+            content = file.read_bytes()
+            try:
+                return _json_loads(content), content
+            except _JSONDecodeError:
+                # tasks.json is JSONC; only pay for comment stripping when plain JSON fails
+                return _json_loads(_strip_json_comments(content.decode('utf-8'))), content
+        except FileNotFoundError:
+            return None, None
         except Exception as e:
             console.print(f"[yellow]⚠ Failed to parse tasks.json: {e}[/yellow]")
-            return None
+            return None, None
 
-    def _save_tasks(file: Path, data: Dict[str, Any]) -> bool:
+    def _save_tasks(file: Path, data: Dict[str, Any], original: Optional[bytes]) -> bool:
         try:
-            file.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+            payload = _json_dumps(data)
+            if payload == original:
+                # Nothing changed, so leave the file (and its mtime) alone
+                return True
+            atomic_write(file, payload)
             return True
         except Exception as e:
             console.print(f"[red]✗ Failed to save tasks.json: {e}[/red]")
@@ -54,7 +84,7 @@ def install_vscode_tasks(config: JasmineConfig, targets: Optional[List[str]] = N
         if not getattr(config, 'sweep_file_path', None): return None
         sweep_path = Path(config.sweep_file_path)
         log_path = sweep_path.with_suffix(".log")
-        cmd = r"(uv run jasminetool sweep start -f ${file} 2>&1)" + f" | tee {log_path}"
+        cmd = r"uv run jasminetool sweep start -f ${file}" + f" -l {log_path}"
         return _create_task("wandb sweep", cmd)
 
     def _create_parallel_all(targets: List[str]) -> Dict[str, Any]:
@@ -71,9 +101,33 @@ def install_vscode_tasks(config: JasmineConfig, targets: Optional[List[str]] = N
     if not vscode_dir:
         return False
     tasks_file = vscode_dir / "tasks.json"
-    tasks_data = _load_tasks(tasks_file) or {"version": "2.0.0", "tasks": []}
-    tasks_data.setdefault("tasks", [])
-    existing_labels = {t.get("label") for t in tasks_data["tasks"]}
+    tasks_data, tasks_raw = _load_tasks(tasks_file)
+    tasks_data = tasks_data or {"version": "2.0.0", "tasks": []}
+    tasks = tasks_data.setdefault("tasks", [])
+    # label -> first position, so overwriting a task is a direct index instead of rebuilding the list
+    label_index: Dict[Any, int] = {}
+    duplicate_labels = set()
+    for i, t in enumerate(tasks):
+        if t.get("label") in label_index:
+            duplicate_labels.add(t.get("label"))
+        label_index.setdefault(t.get("label"), i)
+    existing_labels = set(label_index)
+
+    def _upsert_task(task: Dict[str, Any]):
+        label = task["label"]
+        idx = label_index.get(label)
+        if idx is None:
+            label_index[label] = len(tasks)
+            tasks.append(task)
+            return
+        tasks[idx] = task
+        if label in duplicate_labels:
+            # Overwriting a label leaves a single task with it, so drop the hand-made copies (rare, so re-index)
+            duplicate_labels.discard(label)
+            tasks[:] = [t for i, t in enumerate(tasks) if i == idx or t.get("label") != label]
+            label_index.clear()
+            for i, t in enumerate(tasks):
+                label_index.setdefault(t.get("label"), i)
 
     if targets is None:
         targets = get_server_name_list(config)
@@ -95,32 +149,29 @@ def install_vscode_tasks(config: JasmineConfig, targets: Optional[List[str]] = N
                 skipped += 1
                 continue
             if label in existing_labels:
-                tasks_data["tasks"] = [t for t in tasks_data["tasks"] if t.get("label") != label]
                 updated += 1
             else:
                 added += 1
-            tasks_data["tasks"].append(task)
+            _upsert_task(task)
             table.add_row(label, "[green]installed[/green]")
 
     if len(targets) > 1:
         all_label = "sweep [all]"
         all_task = _create_parallel_all(targets)
         if all_label not in existing_labels or force:
-            tasks_data["tasks"] = [t for t in tasks_data["tasks"] if t.get("label") != all_label]
-            tasks_data["tasks"].append(all_task)
+            _upsert_task(all_task)
             table.add_row(all_label, "[green]installed[/green]")
 
     sweep_task = _create_sweep_start(config)
     if sweep_task:
         label = sweep_task["label"]
         if label not in existing_labels or force:
-            tasks_data["tasks"] = [t for t in tasks_data["tasks"] if t.get("label") != label]
-            tasks_data["tasks"].append(sweep_task)
+            _upsert_task(sweep_task)
             table.add_row(label, "[green]installed[/green]")
         else:
             table.add_row(label, "[yellow]skipped[/yellow]")
 
-    success = _save_tasks(tasks_file, tasks_data)
+    success = _save_tasks(tasks_file, tasks_data, tasks_raw)
     if success:
         console.print(table)
         console.print(f"\n[bold green]✅ VS Code tasks updated ({added} added, {updated} overwritten, {skipped} skipped)[/bold green]")
@@ -0,0 +1,116 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from jasminetool.core.git_utils import read_git_status, remote_git_sync_cmd, format_changes, MAX_LISTED_CHANGES
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> str:
+    res = subprocess.run(["git", "-C", str(repo), *args], capture_output=True, text=True, check=True)
+    return res.stdout.strip()
+
+
+def _commit_all(repo: Path, message: str):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.name", "test")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "commit.gpgsign", "false")
+    (repo / "a.txt").write_text("a\n")
+    (repo / "b.txt").write_text("b\n")
+    _commit_all(repo, "init")
+    return repo
+
+
+def test_clean_repo(repo: Path):
+    branch, head, changes = read_git_status(repo)
+    assert branch == "main"
+    assert head == _git(repo, "rev-parse", "HEAD")
+    assert changes == []
+
+
+def test_not_a_repo(tmp_path: Path):
+    assert read_git_status(tmp_path) is None
+
+
+def test_ordinary_entries(repo: Path):
+    (repo / "a.txt").write_text("changed\n")
+    (repo / "b.txt").write_text("staged\n")
+    _git(repo, "add", "b.txt")
+    _, _, changes = read_git_status(repo)
+    assert sorted(changes) == [" M a.txt", "M  b.txt"]
+
+
+def test_rename_entry(repo: Path):
+    _git(repo, "mv", "a.txt", "renamed.txt")
+    _, _, changes = read_git_status(repo)
+    assert changes == ["R  a.txt -> renamed.txt"]
+
+
+def test_untracked_entry_with_space(repo: Path):
+    (repo / "new file.txt").write_text("new\n")
+    _, _, changes = read_git_status(repo)
+    assert changes == ["?? new file.txt"]
+
+
+def test_unmerged_entry(repo: Path):
+    _git(repo, "checkout", "-q", "-b", "other")
+    (repo / "a.txt").write_text("other\n")
+    _commit_all(repo, "other")
+    _git(repo, "checkout", "-q", "main")
+    (repo / "a.txt").write_text("main\n")
+    _commit_all(repo, "main")
+    subprocess.run(["git", "-C", str(repo), "merge", "-q", "other"], capture_output=True)
+    _, _, changes = read_git_status(repo)
+    assert changes == ["UU a.txt"]
+
+
+def test_detached_head(repo: Path):
+    head = _git(repo, "rev-parse", "HEAD")
+    _git(repo, "checkout", "-q", "--detach")
+    branch, oid, changes = read_git_status(repo)
+    assert branch == "HEAD"
+    assert oid == head
+    assert changes == []
+
+
+def test_remote_git_sync_cmd_quotes_branch(repo: Path, tmp_path: Path):
+    # Legal in a ref name, but a shell would expand or split it if left unquoted
+    branch = "feat/$(touch${IFS}pwned);it's&x"
+    _git(repo, "checkout", "-q", "-b", branch)
+    (repo / "a.txt").write_text("feature\n")
+    _commit_all(repo, "feature")
+    head = _git(repo, "rev-parse", "HEAD")
+
+    clone = tmp_path / "clone"
+    subprocess.run(["git", "clone", "-q", "-b", "main", str(repo), str(clone)], check=True)
+    # Leave a local edit behind; the sync is expected to discard it
+    (clone / "b.txt").write_text("local edit\n")
+
+    subprocess.run(["sh", "-c", remote_git_sync_cmd(branch, head)], cwd=clone, check=True, capture_output=True)
+    assert _git(clone, "rev-parse", "--abbrev-ref", "HEAD") == branch
+    assert _git(clone, "rev-parse", "HEAD") == head
+    assert _git(clone, "status", "--porcelain") == ""
+    assert not (clone / "pwned").exists()
+
+    # Re-syncing the same commit skips the fetch and is still a no-op checkout
+    subprocess.run(["sh", "-c", remote_git_sync_cmd(branch, head)], cwd=clone, check=True, capture_output=True)
+    assert _git(clone, "rev-parse", "HEAD") == head
+
+
+def test_format_changes_truncates():
+    changes = [f"?? f{i}" for i in range(MAX_LISTED_CHANGES + 3)]
+    lines = format_changes(changes).splitlines()
+    assert lines[:MAX_LISTED_CHANGES] == changes[:MAX_LISTED_CHANGES]
+    assert lines[-1] == "... and 3 more"